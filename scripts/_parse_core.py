@@ -0,0 +1,81 @@
+"""
+_parse_core.py -- Markdown extraction helpers used by parse_docs.py.
+
+Kept free of I/O and fully annotated so it can be compiled ahead of time:
+
+    cd scripts && mypyc _parse_core.py
+
+The compiled extension is picked up by ``import _parse_core`` automatically;
+without it the plain Python module is imported instead.
+"""
+
+import re
+
+FRONT_MATTER_RE = re.compile(r'^---\s*\n(.*?\n)---', re.DOTALL)
+FRONT_MATTER_KV_RE = re.compile(r'(?m)^[ \t]*([^:\n]*?)[ \t]*:[ \t]*["\']*(.*?)["\']*[ \t\r]*$')
+H2_SPLIT_RE = re.compile(r'(?m)^## +(\S[^\n]*)\n')
+# Info string + newline that must follow an opening ``` fence
+FENCE_INFO_RE = re.compile(r'(?:powershell|ps1|posh)?\s*\n', re.IGNORECASE)
+MD_CHARS_RE = re.compile(r'[*_`]')
+# A markdown link (group 1 = link text) or a single emphasis/code character
+DESC_MARKDOWN_RE = re.compile(r'\[([^\]]+)\]\([^)]+\)|[*_`]')
+
+
+def parse_front_matter(text: str) -> dict[str, str]:
+    """Extract YAML front matter fields as a dict."""
+    m = FRONT_MATTER_RE.match(text)
+    if not m:
+        return {}
+    # key: "value" pairs, with whitespace and surrounding quotes trimmed
+    return dict(FRONT_MATTER_KV_RE.findall(m.group(1)))
+
+
+def split_sections(text: str) -> dict[str, str]:
+    """Split markdown into {HEADING: content} for every ## heading, in one pass."""
+    parts = H2_SPLIT_RE.split(text)
+    sections: dict[str, str] = {}
+    for heading, body in zip(parts[1::2], parts[2::2]):
+        # First occurrence wins, matching a top-down search for the heading
+        sections.setdefault(heading.strip().upper(), body.strip())
+    return sections
+
+
+def extract_code_blocks(section_text: str, max_blocks: int = 3) -> list[str]:
+    """Return up to max_blocks fenced code block contents."""
+    cleaned: list[str] = []
+    found = 0
+    pos = 0
+    # Walk fence to fence and stop after max_blocks, instead of matching
+    # every block in the section
+    while found < max_blocks:
+        start = section_text.find('```', pos)
+        if start < 0:
+            break
+        info = FENCE_INFO_RE.match(section_text, start + 3)
+        if not info:
+            # Not an opening fence (e.g. ```yaml); resume one char later
+            pos = start + 1
+            continue
+        end = section_text.find('```', info.end())
+        if end < 0:
+            break
+        found += 1
+        pos = end + 3
+        b = section_text[info.end():end]
+        lines = [l for l in b.strip().splitlines() if not l.strip().startswith('#')]
+        code = '\n'.join(lines).strip()
+        if code:
+            cleaned.append(code)
+    return cleaned
+
+
+def clean_description(synopsis_sec: str) -> str:
+    """First line of a SYNOPSIS section with markdown links and emphasis removed."""
+    description = synopsis_sec.partition('\n')[0].strip()
+    return DESC_MARKDOWN_RE.sub(_strip_markdown, description).strip()
+
+
+def _strip_markdown(m: re.Match[str]) -> str:
+    """Replace a link with its text (minus emphasis chars) and drop the rest."""
+    link_text = m.group(1)
+    return MD_CHARS_RE.sub('', link_text) if link_text else ''
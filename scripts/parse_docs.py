@@ -11,13 +11,30 @@ Output:
     public/data/modules/{Module}.json
 """
 
+import io
 import os
 import re
 import json
 import sys
+import time
 import urllib.request
 import urllib.error
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from xml.etree import ElementTree
+
+from _parse_core import (
+    clean_description,
+    extract_code_blocks,
+    parse_front_matter,
+    split_sections,
+)
+
+try:
+    import orjson  # optional: C-accelerated encoder, output matches stdlib json
+except ImportError:
+    orjson = None
 
 # -- Workload directories relative to the repo root -------------------------
 WORKLOAD_DIRS = [
@@ -46,6 +63,18 @@ EXCHANGE_CATEGORY_MAP = [
     (r'AddressBook|AddressList|EmailAddress|GlobalAddressList', 'Address Management'),
 ]
 
+# One regex for the whole map. Each alternative is anchored at the start and
+# scans forward, so the first *listed* pattern that matches anywhere wins,
+# exactly like testing the patterns one by one in order.
+EXCHANGE_CATEGORY_RE = re.compile(
+    '^(?:' + '|'.join(
+        f'(?P<g{i}>.*?(?:{pattern}))'
+        for i, (pattern, _) in enumerate(EXCHANGE_CATEGORY_MAP)
+    ) + ')',
+    re.IGNORECASE,
+)
+EXCHANGE_CATEGORIES = [cat for _, cat in EXCHANGE_CATEGORY_MAP]
+
 VERB_RE = re.compile(r'^([A-Z][a-z]+)-')
 CMDLET_RE = re.compile(r'^[A-Z][a-z]+-[A-Z]\w+')
 
@@ -65,27 +94,49 @@ PSGALLERY_API = (
     "&$top=1"
     "&$filter=IsPrerelease%20eq%20false"
 )
+GALLERY_VERSION_TAG = '{http://schemas.microsoft.com/ado/2007/08/dataservices}Version'
+GALLERY_RETRIES = 3        # extra attempts after the first request fails
+GALLERY_BACKOFF = 0.3      # seconds; doubled after every failed attempt
 
 
 def fetch_gallery_version(package_name):
     """Fetch the latest stable version of a package from PowerShell Gallery."""
     url = PSGALLERY_API.format(package_name)
+    req = urllib.request.Request(url, headers={'User-Agent': 'ExchIndex/1.0'})
+    for attempt in range(GALLERY_RETRIES + 1):
+        try:
+            with urllib.request.urlopen(req, timeout=15) as resp:
+                data = resp.read()
+            break
+        except (urllib.error.URLError, OSError) as e:
+            # Client errors (bad package id etc.) will not fix themselves
+            transient = not isinstance(e, urllib.error.HTTPError) or e.code >= 500 or e.code == 429
+            if not transient or attempt == GALLERY_RETRIES:
+                print(f"  Warning: Could not fetch version for {package_name}: {e}")
+                return ''
+            time.sleep(GALLERY_BACKOFF * 2 ** attempt)
+    # Stream the OData feed and stop at the first <d:Version> element
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'ExchIndex/1.0'})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            data = resp.read().decode('utf-8')
-        m = re.search(r'<d:Version[^>]*>([^<]+)</d:Version>', data)
-        return m.group(1) if m else ''
-    except (urllib.error.URLError, OSError) as e:
-        print(f"  Warning: Could not fetch version for {package_name}: {e}")
-        return ''
+        for _, elem in ElementTree.iterparse(io.BytesIO(data)):
+            if elem.tag == GALLERY_VERSION_TAG:
+                return (elem.text or '').strip()
+    except ElementTree.ParseError as e:
+        print(f"  Warning: Could not parse Gallery response for {package_name}: {e}")
+    return ''
 
 
 def fetch_module_versions():
     """Fetch latest stable versions for all known modules from PowerShell Gallery."""
+    # I/O bound: issue all Gallery requests concurrently, then report in order
+    with ThreadPoolExecutor(max_workers=len(MODULE_PACKAGE_MAP)) as executor:
+        fetched = dict(zip(
+            MODULE_PACKAGE_MAP,
+            executor.map(fetch_gallery_version, MODULE_PACKAGE_MAP.values()),
+        ))
+
     versions = {}
     for module_name, package_name in MODULE_PACKAGE_MAP.items():
-        ver = fetch_gallery_version(package_name)
+        ver = fetched[module_name]
         if ver:
             versions[module_name] = ver
             print(f"  {module_name}: v{ver} (from {package_name})")
@@ -97,60 +148,40 @@ def fetch_module_versions():
 def get_exchange_category(cmdlet_name):
     """Map an Exchange cmdlet to a sub-category by its noun."""
     noun = cmdlet_name.split('-', 1)[1] if '-' in cmdlet_name else ''
-    for pattern, cat in EXCHANGE_CATEGORY_MAP:
-        if re.search(pattern, noun, re.IGNORECASE):
-            return cat
-    return 'Exchange General'
-
-
-def parse_front_matter(text):
-    """Extract YAML front matter fields as a dict."""
-    m = re.match(r'^---\s*\n(.*?\n)---', text, re.DOTALL)
-    if not m:
-        return {}
-    block = m.group(1)
-    result = {}
-    for line in block.splitlines():
-        kv = line.split(':', 1)
-        if len(kv) == 2:
-            result[kv[0].strip()] = kv[1].strip().strip('"\'')
-    return result
-
-
-def extract_section(text, section_name):
-    """Extract content under a ## SECTION_NAME heading."""
-    pattern = rf'## {re.escape(section_name)}\s*\n(.*?)(?=\n## |\Z)'
-    m = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
-    return m.group(1).strip() if m else ''
-
-
-def extract_code_blocks(section_text, max_blocks=3):
-    """Return up to max_blocks fenced code block contents."""
-    blocks = re.findall(
-        r'```(?:powershell|ps1|posh)?\s*\n(.*?)```',
-        section_text, re.DOTALL | re.IGNORECASE,
-    )
-    cleaned = []
-    for b in blocks[:max_blocks]:
-        lines = [l for l in b.strip().splitlines() if not l.strip().startswith('#')]
-        code = '\n'.join(lines).strip()
-        if code:
-            cleaned.append(code)
-    return cleaned
-
-
-def parse_cmdlet_doc(filepath, workload_name):
+    return _noun_category(noun)
+
+
+@lru_cache(maxsize=None)
+def _noun_category(noun):
+    """Memoized noun lookup; many cmdlets share a noun across verbs."""
+    m = EXCHANGE_CATEGORY_RE.match(noun)
+    return EXCHANGE_CATEGORIES[int(m.lastgroup[1:])] if m else 'Exchange General'
+
+
+def parse_cmdlet_doc(filename, filepath, workload_name):
     """
-    Parse a single cmdlet markdown file.
+    Parse a single cmdlet markdown file (filename is its '<stem>.md' basename).
     Returns dict with: name, module, category, description, syntax, examples
     or None if this is not a cmdlet file.
+    The filename stem is expected to have been checked against CMDLET_RE.
     """
-    text = Path(filepath).read_text(encoding='utf-8', errors='replace')
+    stem = filename[:-3]
+
+    with open(filepath, 'rb') as f:
+        data = f.read()
+    if data.startswith(b'\xef\xbb\xbf'):
+        data = data[3:]  # UTF-8 BOM
+    # Cmdlet pages always open with front matter; skip landing/overview pages
+    # without paying for the decode and regex passes
+    if not data.startswith(b'---'):
+        return None
+    text = data.decode('utf-8', errors='replace')
     front = parse_front_matter(text)
 
     # Cmdlet name: prefer 'title' front-matter field, fall back to filename stem
-    name = front.get('title') or Path(filepath).stem
-    if not CMDLET_RE.match(name):
+    # (the caller has already filtered on the stem, so only re-check a title)
+    name = front.get('title') or stem
+    if name != stem and not CMDLET_RE.match(name):
         return None
 
     # Module name from front matter
@@ -162,17 +193,15 @@ def parse_cmdlet_doc(filepath, workload_name):
     else:
         category = workload_name
 
-    synopsis_sec = extract_section(text, 'SYNOPSIS')
-    description = synopsis_sec.splitlines()[0].strip() if synopsis_sec else ''
-    # Clean up markdown
-    description = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', description)
-    description = re.sub(r'[*_`]', '', description).strip()
+    sections = split_sections(text)
+
+    description = clean_description(sections.get('SYNOPSIS', ''))
 
-    syntax_sec = extract_section(text, 'SYNTAX')
+    syntax_sec = sections.get('SYNTAX', '')
     syntax_blocks = extract_code_blocks(syntax_sec, 1)
     syntax = syntax_blocks[0] if syntax_blocks else ''
 
-    examples_sec = extract_section(text, 'EXAMPLES')
+    examples_sec = sections.get('EXAMPLES', '')
     examples = extract_code_blocks(examples_sec, 3)
 
     return {
@@ -185,6 +214,25 @@ def parse_cmdlet_doc(filepath, workload_name):
     }
 
 
+def dump_json(obj, indent=False):
+    """Encode obj as UTF-8 JSON bytes: compact by default, 2-space indented if asked."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def write_json(path, obj, indent=False):
+    """Write obj to path as JSON (see dump_json)."""
+    Path(path).write_bytes(dump_json(obj, indent))
+
+
+def _parse_worker(args):
+    """ProcessPoolExecutor entry point: unpack (filename, filepath, workload_name)."""
+    return parse_cmdlet_doc(*args)
+
+
 def main():
     if len(sys.argv) < 2:
         print("Usage: python parse_docs.py <office-docs-powershell-root>")
@@ -201,72 +249,109 @@ def main():
     module_versions = fetch_module_versions()
     primary_version = module_versions.get('ExchangePowerShell', '0.0.0')
 
-    manifest_entries = []
+    manifest_count = 0
     descriptions = {}
-    modules_data = {}  # module_name -> {module, cmdlets: {}}
-
-    for rel_path, workload_name in WORKLOAD_DIRS:
-        workload_dir = docs_root / rel_path
-        if not workload_dir.is_dir():
-            print(f"Warning: {workload_dir} not found, skipping {workload_name}")
-            continue
-
-        count = 0
-        for md_file in sorted(workload_dir.glob('*.md')):
-            result = parse_cmdlet_doc(md_file, workload_name)
-            if not result:
+    # module_name -> {module, version, names: [], syntaxes: [], examples: []}
+    # Parallel lists are zipped into the 'cmdlets' mapping only when written.
+    modules_data = {}
+
+    # manifest.json is streamed entry by entry as results arrive, so the full
+    # list of records is never held in memory. It goes to a temp file that
+    # replaces manifest.json only once complete, so a failed run leaves the
+    # previous manifest intact.
+    manifest_tmp = out_dir / 'manifest.json.tmp'
+    with ProcessPoolExecutor() as executor, \
+            open(manifest_tmp, 'wb') as manifest_file:
+        manifest_file.write(b'{"v":' + dump_json(primary_version) + b',"d":[')
+        for rel_path, workload_name in WORKLOAD_DIRS:
+            workload_dir = docs_root / rel_path
+            if not workload_dir.is_dir():
+                print(f"Warning: {workload_dir} not found, skipping {workload_name}")
                 continue
 
-            cname = result['name']
-            vm = VERB_RE.match(cname)
-            verb = vm.group(1) if vm else 'Other'
-            module = result['module']
-
-            manifest_entries.append({
-                'n': cname,
-                'v': verb,
-                'm': module,
-                'c': result['category'],
-                'e': bool(result['examples']),
-            })
-
-            if result['description']:
-                descriptions[cname] = result['description']
-
-            if module not in modules_data:
-                modules_data[module] = {
-                    'module': module,
-                    'version': module_versions.get(module, ''),
-                    'cmdlets': {},
-                }
-
-            modules_data[module]['cmdlets'][cname] = {
-                'syntax': result['syntax'],
-                'examples': result['examples'],
-            }
-            count += 1
-
-        print(f"  {workload_name}: {count} cmdlets from {workload_dir}")
-
-    print(f"\nProcessed {len(manifest_entries)} cmdlets across {len(modules_data)} modules")
-
-    # Write manifest.json
-    manifest = {'v': primary_version, 'd': manifest_entries}
-    with open(out_dir / 'manifest.json', 'w', encoding='utf-8') as f:
-        json.dump(manifest, f, separators=(',', ':'))
-    print(f"Wrote manifest.json ({len(manifest_entries)} entries)")
+            # Reject README/TOC/overview pages by filename before any file I/O
+            with os.scandir(workload_dir) as it:
+                md_files = sorted(
+                    (entry.name, entry.path) for entry in it
+                    if entry.name.endswith('.md') and CMDLET_RE.match(entry.name[:-3])
+                )
+
+            count = 0
+            # Parsing is CPU-bound regex work; fan it out and collect in order
+            results = executor.map(
+                _parse_worker,
+                ((name, path, workload_name) for name, path in md_files),
+                chunksize=64,
+            )
+            for result in results:
+                if not result:
+                    continue
+
+                cname = result['name']
+                vm = VERB_RE.match(cname)
+                # Results arrive unpickled from the workers as fresh copies of
+                # a handful of values; intern them so all entries share one object
+                verb = sys.intern(vm.group(1) if vm else 'Other')
+                module = sys.intern(result['module'])
+                category = sys.intern(result['category'])
+
+                if manifest_count:
+                    manifest_file.write(b',')
+                manifest_file.write(dump_json({
+                    'n': cname,
+                    'v': verb,
+                    'm': module,
+                    'c': category,
+                    'e': bool(result['examples']),
+                }))
+                manifest_count += 1
+
+                if result['description']:
+                    descriptions[cname] = result['description']
+
+                if module not in modules_data:
+                    modules_data[module] = {
+                        'module': module,
+                        'version': module_versions.get(module, ''),
+                        'names': [],
+                        'syntaxes': [],
+                        'examples': [],
+                    }
+
+                mod_data = modules_data[module]
+                mod_data['names'].append(cname)
+                mod_data['syntaxes'].append(result['syntax'])
+                mod_data['examples'].append(result['examples'])
+                count += 1
+
+            print(f"  {workload_name}: {count} cmdlets from {workload_dir}")
+
+        manifest_file.write(b']}')
+    os.replace(manifest_tmp, out_dir / 'manifest.json')
+
+    print(f"\nProcessed {manifest_count} cmdlets across {len(modules_data)} modules")
+    print(f"Wrote manifest.json ({manifest_count} entries)")
 
     # Write descriptions.json
-    with open(out_dir / 'descriptions.json', 'w', encoding='utf-8') as f:
-        json.dump(descriptions, f, indent=2, ensure_ascii=False)
+    write_json(out_dir / 'descriptions.json', descriptions, indent=True)
     print(f"Wrote descriptions.json ({len(descriptions)} entries)")
 
-    # Write per-module JSON files
-    for mod_name, data in modules_data.items():
+    # Write per-module JSON files (independent, so write them concurrently)
+    def write_module(item):
+        mod_name, data = item
         safe_name = mod_name.replace(' ', '_')
-        out_file = modules_dir / f'{safe_name}.json'
-        with open(out_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        write_json(modules_dir / f'{safe_name}.json', {
+            'module': data['module'],
+            'version': data['version'],
+            'cmdlets': dict(zip(data['names'], (
+                {'syntax': syntax, 'examples': examples}
+                for syntax, examples in zip(data['syntaxes'], data['examples'])
+            ))),
+        })
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Drain the iterator so any write error is raised here
+        list(executor.map(write_module, modules_data.items()))
     print(f"Wrote {len(modules_data)} module JSON files to {modules_dir}")
 
 